@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import concurrent.futures
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import gi
 
@@ -18,244 +23,68 @@ except (ValueError, ImportError):
     gi.require_version("AppIndicator3", "0.1")
     from gi.repository import AppIndicator3 as AppIndicator
 
-from gi.repository import GLib, Gtk, Notify
+from gi.repository import Gio, GLib, Gtk, Notify
 
-from backend import ShaperBackend
-from config import ConfigStore, preset_names, validate_preset
+from backend import NM_BUS_NAME, BackendResult, ShaperBackend, parse_nm_objects
+from config import ConfigStore, preset_names
 from i18n import I18N
+from paths import AUTOSTART_PATH, CONFIG_PATH, LOG_PATH, STATE_DIR
+
+if TYPE_CHECKING:
+    from settings_window import SettingsWindow
 
 APP_ID = "io.github.wondershaper.quicktoggle"
 APP_NAME = "Wondershaper QuickToggle"
-CONFIG_DIR = Path.home() / ".config" / "wondershaper-quicktoggle"
-STATE_DIR = Path.home() / ".local" / "state" / "wondershaper-quicktoggle"
-CONFIG_PATH = CONFIG_DIR / "config.json"
-LOG_PATH = STATE_DIR / "app.log"
-AUTOSTART_PATH = Path.home() / ".config" / "autostart" / "wondershaper-quicktoggle.desktop"
+NIC_CACHE_TTL = 2.0
+CONFIG_SAVE_DELAY_MS = 200
+AUTOSTART_ENTRY = (
+    b"[Desktop Entry]\n"
+    b"Type=Application\n"
+    b"Name=Wondershaper QuickToggle\n"
+    b"Exec=/usr/bin/wondershaper-quicktoggle\n"
+    b"X-GNOME-Autostart-enabled=true\n"
+)
+
+T = TypeVar("T")
 
 
-def setup_logging() -> logging.Logger:
+def setup_logging() -> Tuple[logging.Logger, logging.handlers.QueueListener]:
     STATE_DIR.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger("wsqt")
     logger.setLevel(logging.INFO)
-    handler = logging.FileHandler(LOG_PATH)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.handlers.RotatingFileHandler(LOG_PATH, maxBytes=1_000_000, backupCount=3)
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
-    logger.addHandler(handler)
-    return logger
-
-
-class SettingsWindow(Gtk.Window):
-    def __init__(self, app: "QuickToggleApp") -> None:
-        super().__init__(title=app.t("settings_title"))
-        self.app = app
-        self.set_default_size(430, 320)
-        self.set_border_width(10)
-
-        root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        self.add(root)
-
-        # Status indicator at the top
-        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        status_label = Gtk.Label()
-        status_text = app.t("status_enabled") if app.config.get("enabled") else app.t("status_disabled")
-        active_preset = app.config.get("active_preset", "Work")
-        preset_text = app.t("status_active_preset", preset=active_preset)
-        status_label.set_markup(f"<b>{status_text}</b> — {preset_text}")
-        status_box.pack_start(status_label, True, True, 0)
-        root.pack_start(status_box, False, False, 0)
-
-        separator = Gtk.Separator()
-        root.pack_start(separator, False, False, 0)
-
-        self.iface_combo = Gtk.ComboBoxText()
-        self._fill_ifaces()
-        root.pack_start(self._row(app.t("settings_iface"), self.iface_combo), False, False, 0)
-
-        self.lang_combo = Gtk.ComboBoxText()
-        for code, label in app.i18n.available_languages().items():
-            self.lang_combo.append(code, label)
-        self.lang_combo.set_active_id(app.config["language"])
-        root.pack_start(self._row(app.t("settings_language"), self.lang_combo), False, False, 0)
-
-        self.preset_combo = Gtk.ComboBoxText()
-        self._fill_presets()
-        root.pack_start(self._row(app.t("settings_preset"), self.preset_combo), False, False, 0)
-
-        self.name_entry = Gtk.Entry()
-        self.down_entry = Gtk.Entry()
-        self.up_entry = Gtk.Entry()
-        root.pack_start(self._row(app.t("settings_preset_name"), self.name_entry), False, False, 0)
-        root.pack_start(self._row(app.t("settings_down_mbps"), self.down_entry), False, False, 0)
-        root.pack_start(self._row(app.t("settings_up_mbps"), self.up_entry), False, False, 0)
-
-        self.startup_check = Gtk.CheckButton.new_with_label(app.t("settings_startup"))
-        self.startup_check.set_active(bool(app.config.get("start_on_login", False)))
-        root.pack_start(self.startup_check, False, False, 0)
-
-        preset_mgmt_bar = Gtk.Box(spacing=8)
-        add_preset_btn = Gtk.Button(label=app.t("preset_add"))
-        delete_preset_btn = Gtk.Button(label=app.t("preset_delete"))
-        add_preset_btn.connect("clicked", self.on_add_preset)
-        delete_preset_btn.connect("clicked", self.on_delete_preset)
-        preset_mgmt_bar.pack_start(add_preset_btn, True, True, 0)
-        preset_mgmt_bar.pack_start(delete_preset_btn, True, True, 0)
-        root.pack_start(preset_mgmt_bar, False, False, 0)
-
-        button_bar = Gtk.Box(spacing=8)
-        apply_btn = Gtk.Button(label=app.t("settings_apply_now"))
-        disable_btn = Gtk.Button(label=app.t("settings_disable"))
-        save_btn = Gtk.Button(label=app.t("settings_save"))
-        apply_btn.connect("clicked", self.on_apply)
-        disable_btn.connect("clicked", self.on_disable)
-        save_btn.connect("clicked", self.on_save)
-        button_bar.pack_start(apply_btn, True, True, 0)
-        button_bar.pack_start(disable_btn, True, True, 0)
-        button_bar.pack_start(save_btn, True, True, 0)
-        root.pack_end(button_bar, False, False, 0)
-
-        self.preset_combo.connect("changed", self.on_preset_changed)
-        self._load_current_preset()
-
-    def _row(self, label: str, widget: Gtk.Widget) -> Gtk.Box:
-        row = Gtk.Box(spacing=8)
-        row.pack_start(Gtk.Label(label=label, xalign=0), True, True, 0)
-        row.pack_end(widget, False, False, 0)
-        return row
-
-    def _fill_ifaces(self) -> None:
-        self.iface_combo.remove_all()
-        interfaces = self.app.backend.list_interfaces()
-        for iface in interfaces:
-            self.iface_combo.append(iface, iface)
-        current_iface = self.app.config.get("iface") or self.app.backend.detect_iface()
-        if current_iface:
-            self.iface_combo.set_active_id(current_iface)
-
-    def _fill_presets(self) -> None:
-        self.preset_combo.remove_all()
-        for preset in self.app.config["presets"]:
-            name = preset["name"]
-            self.preset_combo.append(name, name)
-        self.preset_combo.append("Custom", self.app.t("preset_custom"))
-        self.preset_combo.set_active_id(self.app.config.get("active_preset", "Work"))
-
-    def _load_current_preset(self) -> None:
-        preset_name = self.preset_combo.get_active_id() or self.app.config.get("active_preset", "Work")
-        if preset_name == "Custom":
-            data = self.app.config["custom"]
-            self.name_entry.set_text(self.app.t("preset_custom"))
-        else:
-            data = next((p for p in self.app.config["presets"] if p["name"] == preset_name), self.app.config["presets"][0])
-            self.name_entry.set_text(data["name"])
-        self.down_entry.set_text(str(data["down_mbps"]))
-        self.up_entry.set_text(str(data["up_mbps"]))
-
-    def on_preset_changed(self, _widget: Gtk.Widget) -> None:
-        self._load_current_preset()
-
-    def on_add_preset(self, _widget: Gtk.Widget) -> None:
-        name = self.name_entry.get_text().strip()
-        if not name:
-            self.app.notify("error_preset_empty_name")
-            return
-        try:
-            down_mbps = int(self.down_entry.get_text())
-            up_mbps = int(self.up_entry.get_text())
-            new_preset = {"name": name, "down_mbps": down_mbps, "up_mbps": up_mbps}
-            validate_preset(new_preset)
-            self.app.config["presets"].append(new_preset)
-            self.app.save_config()
-            self.app.rebuild_menu()
-            self._fill_presets()
-            self.preset_combo.set_active_id(name)
-            self.app.notify("preset_added")
-        except (ValueError, TypeError):
-            self.app.notify("error_invalid_values")
-
-    def on_delete_preset(self, _widget: Gtk.Widget) -> None:
-        if len(self.app.config["presets"]) <= 1:
-            self.app.notify("error_cannot_delete_last")
-            return
-        selected = self.preset_combo.get_active_id()
-        if selected == "Custom":
-            self.app.notify("error_cannot_delete_last")
-            return
-        self.app.config["presets"] = [p for p in self.app.config["presets"] if p["name"] != selected]
-        if self.app.config.get("active_preset") == selected:
-            self.app.config["active_preset"] = self.app.config["presets"][0]["name"]
-        self.app.save_config()
-        self.app.rebuild_menu()
-        self._fill_presets()
-        self.app.notify("preset_deleted")
-
-    def on_apply(self, _widget: Gtk.Widget) -> None:
-        self._save_to_config()
-        self.app.toggle_on(force=True)
-
-    def on_disable(self, _widget: Gtk.Widget) -> None:
-        self._save_to_config()
-        self.app.toggle_off(force=True)
-
-    def on_save(self, _widget: Gtk.Widget) -> None:
-        self._save_to_config()
-        self.app.notify("notify_saved")
-
-    def _save_to_config(self) -> None:
-        iface = self.iface_combo.get_active_id() or ""
-        language = self.lang_combo.get_active_id() or "en"
-        selected = self.preset_combo.get_active_id() or "Work"
-        self.app.config["iface"] = iface
-        self.app.config["language"] = language
-        self.app.i18n.set_language(language)
-
-        try:
-            if selected == "Custom":
-                self.app.config["custom"] = {
-                    "down_mbps": int(self.down_entry.get_text()),
-                    "up_mbps": int(self.up_entry.get_text()),
-                }
-            else:
-                new_preset = {
-                    "name": self.name_entry.get_text(),
-                    "down_mbps": self.down_entry.get_text(),
-                    "up_mbps": self.up_entry.get_text(),
-                }
-                updated = validate_preset(new_preset)
-                replaced = False
-                for idx, preset in enumerate(self.app.config["presets"]):
-                    if preset["name"] == selected:
-                        self.app.config["presets"][idx] = updated
-                        replaced = True
-                        break
-                if not replaced:
-                    self.app.config["presets"].append(updated)
-                selected = updated["name"]
-        except (ValueError, TypeError):
-            self.app.notify("error_invalid_values")
-            return
-
-        self.app.config["active_preset"] = selected
-        self.app.config["start_on_login"] = self.startup_check.get_active()
-        self.app.sync_autostart()
-        self.app.save_config()
-        self.app.rebuild_menu()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger, listener
 
 
 class QuickToggleApp:
     def __init__(self) -> None:
-        self.logger = setup_logging()
+        self.logger, self._log_listener = setup_logging()
         locale_dir = Path("/usr/share/wondershaper-quicktoggle/i18n")
         if not locale_dir.exists():
             locale_dir = Path(__file__).resolve().parent.parent / "i18n"
         self.i18n = I18N(locale_dir)
+        self.t: Callable[..., str] = self.i18n.t
         self.store = ConfigStore(CONFIG_PATH)
         self.config: Dict[str, Any] = self.store.load()
+        self.rebuild_preset_index()
         self.i18n.set_language(self.config.get("language") or self.i18n.detect_system_language())
 
         helper_path = Path("/usr/lib/wondershaper-quicktoggle/wsqt_helper.py")
         if not helper_path.exists():
             helper_path = Path(__file__).resolve().parent.parent / "helper" / "wsqt_helper.py"
         self.backend = ShaperBackend(helper_path=helper_path)
-        Notify.init(APP_NAME)
+        self._nic_cache: Dict[str, Tuple[float, Any]] = {}
+        self._save_source = 0
+        self.runtime_iface: Optional[str] = None
+        self._helper_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="wsqt-helper")
+        self._helper_pending = 0
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="wsqt-io")
+        self._notify_ready = False
 
         self.indicator = AppIndicator.Indicator.new(
             APP_ID,
@@ -265,71 +94,207 @@ class QuickToggleApp:
         self.indicator.set_status(AppIndicator.IndicatorStatus.ACTIVE)
         self.indicator.set_title(APP_NAME)
         self.settings_window: Optional[SettingsWindow] = None
-        self.menu = Gtk.Menu()
+        self._build_menu()
         self.sync_state_from_helper()
-        self.rebuild_menu()
+
+    def _cached_nic(self, key: str, fetch: Callable[[], T]) -> T:
+        now = time.monotonic()
+        hit = self._nic_cache.get(key)
+        if hit is not None and now - hit[0] < NIC_CACHE_TTL:
+            return hit[1]
+        value = fetch()
+        self._nic_cache[key] = (now, value)
+        return value
+
+    def invalidate_nic_cache(self) -> None:
+        self._nic_cache.clear()
+        self.backend.invalidate_cache()
+
+    def _query_nm_state(self) -> Optional[Tuple[List[str], Optional[str]]]:
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            reply = bus.call_sync(
+                NM_BUS_NAME,
+                "/org/freedesktop",
+                "org.freedesktop.DBus.ObjectManager",
+                "GetManagedObjects",
+                None,
+                GLib.VariantType.new("(a{oa{sa{sv}}})"),
+                Gio.DBusCallFlags.NO_AUTO_START,
+                1000,
+                None,
+            )
+        except GLib.Error:
+            return None
+        (objects,) = reply.unpack()
+        return parse_nm_objects(objects)
+
+    def _nm_state(self) -> Optional[Tuple[List[str], Optional[str]]]:
+        return self._cached_nic("nm", self._query_nm_state)
+
+    def list_interfaces(self) -> List[str]:
+        state = self._nm_state()
+        if state is not None:
+            return state[0]
+        return self.backend.list_interfaces()
+
+    def detect_iface(self) -> Optional[str]:
+        state = self._nm_state()
+        if state is not None:
+            return state[1]
+        return self.backend.detect_iface()
+
+    def resolve_iface(self) -> Optional[str]:
+        self.runtime_iface = self.config.get("iface") or self.detect_iface()
+        return self.runtime_iface
+
+    def get_runtime_iface(self) -> Optional[str]:
+        return self.runtime_iface or self.resolve_iface()
 
     def sync_state_from_helper(self) -> None:
-        iface = self.config.get("iface") or self.backend.detect_iface()
+        iface = self.resolve_iface()
         if not iface:
             self.config["enabled"] = False
             return
         self.config["iface"] = iface
-        result = self.backend.check_status(iface)
+        self._submit_helper(lambda: self.backend.check_status(iface), self._after_status_check)
+
+    def _after_status_check(self, future: "concurrent.futures.Future[BackendResult]") -> None:
+        try:
+            result = future.result()
+        except ValueError:
+            self.logger.error("Status check rejected interface %r", self.config.get("iface"))
+            self.config["enabled"] = False
+            return
+        except Exception:
+            self.logger.exception("Status check failed")
+            self.config["enabled"] = False
+            return
         self.config["enabled"] = bool(result.ok and result.message == "enabled")
         self.save_config()
 
-    def t(self, key: str, **kwargs: object) -> str:
-        return self.i18n.t(key, **kwargs)
-
-    def rebuild_menu(self) -> None:
+    def _submit_helper(
+        self,
+        call: Callable[[], BackendResult],
+        on_done: Callable[["concurrent.futures.Future[BackendResult]"], None],
+    ) -> None:
+        self._helper_pending += 1
+        self.toggle_item.set_sensitive(False)
+        future = self._helper_executor.submit(call)
+        future.add_done_callback(lambda done: GLib.idle_add(self._on_helper_done, done, on_done))
+
+    def _on_helper_done(
+        self,
+        future: "concurrent.futures.Future[BackendResult]",
+        on_done: Callable[["concurrent.futures.Future[BackendResult]"], None],
+    ) -> bool:
+        self._helper_pending -= 1
+        if not self._helper_pending:
+            self.toggle_item.set_sensitive(True)
+        on_done(future)
+        return False
+
+    def _build_menu(self) -> None:
         self.menu = Gtk.Menu()
 
-        toggle_item = Gtk.MenuItem(label=self.t("menu_toggle"))
-        toggle_item.connect("activate", self.on_toggle)
-        self.menu.append(toggle_item)
+        self.toggle_item = Gtk.MenuItem(label=self.t("menu_toggle"))
+        self.toggle_item.connect("activate", self.on_toggle)
+        self.menu.append(self.toggle_item)
+
+        self.presets_item = Gtk.MenuItem(label=self.t("menu_presets"))
+        self._build_presets_menu()
+        self.menu.append(self.presets_item)
 
-        presets_item = Gtk.MenuItem(label=self.t("menu_presets"))
+        self.settings_item = Gtk.MenuItem(label=self.t("menu_settings"))
+        self.settings_item.connect("activate", self.on_open_settings)
+        self.menu.append(self.settings_item)
+
+        self.quit_item = Gtk.MenuItem(label=self.t("menu_quit"))
+        self.quit_item.connect("activate", self.on_quit)
+        self.menu.append(self.quit_item)
+
+        self.menu.show_all()
+        self.indicator.set_menu(self.menu)
+        self._menu_signature_shown = self._menu_signature()
+
+    def _build_presets_menu(self) -> None:
         presets_menu = Gtk.Menu()
         for preset in self.config["presets"]:
             item = Gtk.MenuItem(label=preset["name"])
             item.connect("activate", self.on_select_preset, preset["name"])
             presets_menu.append(item)
-        custom_item = Gtk.MenuItem(label=self.t("preset_custom"))
-        custom_item.connect("activate", self.on_select_preset, "Custom")
-        presets_menu.append(custom_item)
-
-        presets_item.set_submenu(presets_menu)
-        self.menu.append(presets_item)
-
-        settings_item = Gtk.MenuItem(label=self.t("menu_settings"))
-        settings_item.connect("activate", self.on_open_settings)
-        self.menu.append(settings_item)
+        self.custom_preset_item = Gtk.MenuItem(label=self.t("preset_custom"))
+        self.custom_preset_item.connect("activate", self.on_select_preset, "Custom")
+        presets_menu.append(self.custom_preset_item)
+        presets_menu.show_all()
+        self.presets_item.set_submenu(presets_menu)
+        self._menu_preset_names = preset_names(self.config["presets"])
+
+    def refresh_menu(self) -> None:
+        signature = self._menu_signature()
+        if signature == self._menu_signature_shown:
+            return
+        self._menu_signature_shown = signature
+        self._set_item_label(self.toggle_item, self.t("menu_toggle"))
+        self._set_item_label(self.presets_item, self.t("menu_presets"))
+        self._set_item_label(self.settings_item, self.t("menu_settings"))
+        self._set_item_label(self.quit_item, self.t("menu_quit"))
+        if preset_names(self.config["presets"]) != self._menu_preset_names:
+            self._build_presets_menu()
+        else:
+            self._set_item_label(self.custom_preset_item, self.t("preset_custom"))
 
-        quit_item = Gtk.MenuItem(label=self.t("menu_quit"))
-        quit_item.connect("activate", self.on_quit)
-        self.menu.append(quit_item)
+    def _menu_signature(self) -> Tuple[str, Tuple[str, ...]]:
+        return self.i18n.language, tuple(preset_names(self.config["presets"]))
 
-        self.menu.show_all()
-        self.indicator.set_menu(self.menu)
+    @staticmethod
+    def _set_item_label(item: Gtk.MenuItem, text: str) -> None:
+        if item.get_label() != text:
+            item.set_label(text)
 
     def notify(self, key: str, **kwargs: object) -> None:
+        if not self._notify_ready:
+            Notify.init(APP_NAME)
+            self._notify_ready = True
         text = self.t(key, **kwargs)
         notification = Notify.Notification.new(APP_NAME, text, "network-workgroup")
         notification.show()
 
     def save_config(self) -> None:
-        self.store.save(self.config)
+        if not self._save_source:
+            self._save_source = GLib.timeout_add(CONFIG_SAVE_DELAY_MS, self._on_save_timeout)
+
+    def _on_save_timeout(self) -> bool:
+        self._save_source = 0
+        self._io_executor.submit(self._write_config, copy.deepcopy(self.config))
+        return False
+
+    def _write_config(self, snapshot: Dict[str, Any]) -> None:
+        try:
+            self.store.save(snapshot)
+        except Exception:
+            self.logger.exception("Saving config failed")
+
+    def flush_config(self) -> None:
+        if self._save_source:
+            GLib.source_remove(self._save_source)
+            self._on_save_timeout()
+
+    def rebuild_preset_index(self) -> None:
+        # Reversed so the first preset wins on duplicate names.
+        self._preset_by_name = {
+            preset["name"]: preset for preset in reversed(self.config["presets"]) if preset.get("name")
+        }
+
+    def find_preset(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._preset_by_name.get(name)
 
     def active_preset(self) -> Dict[str, Any]:
         selected = self.config.get("active_preset", "Work")
         if selected == "Custom":
             custom = self.config.get("custom", {"down_mbps": 20, "up_mbps": 5})
             return {"name": "Custom", **custom}
-        for preset in self.config["presets"]:
-            if preset["name"] == selected:
-                return preset
-        return self.config["presets"][0]
+        return self.find_preset(selected) or self.config["presets"][0]
 
     def on_toggle(self, _item: Gtk.MenuItem) -> None:
         if self.config.get("enabled"):
@@ -338,17 +303,33 @@ class QuickToggleApp:
             self.toggle_on()
 
     def toggle_on(self, force: bool = False) -> None:
-        iface = self.config.get("iface") or self.backend.detect_iface()
+        iface = self.get_runtime_iface()
         if not iface:
             self.notify("error_iface_not_found")
             return
 
         preset = self.active_preset()
+        self._submit_helper(
+            lambda: self.backend.apply_limits(iface, int(preset["down_mbps"]), int(preset["up_mbps"])),
+            lambda future: self._after_toggle_on(future, iface, preset, force),
+        )
+
+    def _after_toggle_on(
+        self,
+        future: "concurrent.futures.Future[BackendResult]",
+        iface: str,
+        preset: Dict[str, Any],
+        force: bool,
+    ) -> None:
         try:
-            result = self.backend.apply_limits(iface, int(preset["down_mbps"]), int(preset["up_mbps"]))
+            result = future.result()
         except ValueError:
             self.notify("error_invalid_values")
             return
+        except Exception:
+            self.logger.exception("Apply failed")
+            self.notify("error_apply_failed")
+            return
 
         if not result.ok and not force:
             self.logger.error("Apply failed: %s", result.details)
@@ -361,11 +342,25 @@ class QuickToggleApp:
         self.notify("notify_enabled", down=preset["down_mbps"], up=preset["up_mbps"], iface=iface)
 
     def toggle_off(self, force: bool = False) -> None:
-        iface = self.config.get("iface") or self.backend.detect_iface()
+        iface = self.get_runtime_iface()
         if not iface:
             self.notify("error_iface_not_found")
             return
-        result = self.backend.clear_limits(iface)
+        self._submit_helper(
+            lambda: self.backend.clear_limits(iface),
+            lambda future: self._after_toggle_off(future, iface, force),
+        )
+
+    def _after_toggle_off(self, future: "concurrent.futures.Future[BackendResult]", iface: str, force: bool) -> None:
+        try:
+            result = future.result()
+        except ValueError:
+            self.notify("error_invalid_values")
+            return
+        except Exception:
+            self.logger.exception("Disable failed")
+            self.notify("error_disable_failed")
+            return
         if not result.ok and not force:
             self.logger.error("Disable failed: %s", result.details)
             self.notify("error_disable_failed")
@@ -375,14 +370,15 @@ class QuickToggleApp:
         self.notify("notify_disabled", iface=iface)
 
     def on_select_preset(self, _item: Gtk.MenuItem, preset_name: str) -> None:
-        names = set(preset_names(self.config["presets"]))
-        if preset_name == "Custom" or preset_name in names:
+        if preset_name == "Custom" or preset_name in self._preset_by_name:
             self.config["active_preset"] = preset_name
             self.save_config()
             self.notify("notify_preset_selected", preset=preset_name)
 
     def on_open_settings(self, _item: Gtk.MenuItem) -> None:
         if self.settings_window is None:
+            from settings_window import SettingsWindow
+
             self.settings_window = SettingsWindow(self)
             self.settings_window.connect("destroy", self._on_settings_closed)
         self.settings_window.show_all()
@@ -392,20 +388,22 @@ class QuickToggleApp:
         self.settings_window = None
 
     def sync_autostart(self) -> None:
-        AUTOSTART_PATH.parent.mkdir(parents=True, exist_ok=True)
         if self.config.get("start_on_login"):
-            desktop = (
-                "[Desktop Entry]\n"
-                "Type=Application\n"
-                "Name=Wondershaper QuickToggle\n"
-                "Exec=/usr/bin/wondershaper-quicktoggle\n"
-                "X-GNOME-Autostart-enabled=true\n"
-            )
-            AUTOSTART_PATH.write_text(desktop, encoding="utf-8")
+            try:
+                current: Optional[bytes] = AUTOSTART_PATH.read_bytes()
+            except FileNotFoundError:
+                current = None
+            if current != AUTOSTART_ENTRY:
+                AUTOSTART_PATH.parent.mkdir(parents=True, exist_ok=True)
+                AUTOSTART_PATH.write_bytes(AUTOSTART_ENTRY)
         elif AUTOSTART_PATH.exists():
             AUTOSTART_PATH.unlink()
 
     def on_quit(self, _item: Gtk.MenuItem) -> None:
+        self.flush_config()
+        self._helper_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_executor.shutdown(wait=True)
+        self._log_listener.stop()
         Gtk.main_quit()
 
     def run(self) -> None:
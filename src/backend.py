@@ -1,14 +1,77 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
 import shutil
+import string
 import subprocess
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+_IFACE_CHARS = frozenset(string.ascii_letters + string.digits + "_.:-")
+PROBE_CACHE_TTL = 2.0
+_IP_LINK_NAME_RE = re.compile(rb"^\d+:\s*([^:@\s]+)", re.MULTILINE)
+_IP_ROUTE_DEV_RE = re.compile(rb"(?:^|\s)dev\s+(\S+)", re.MULTILINE)
+_NMCLI_CONNECTED_RE = re.compile(rb"^([^:\n]+):connected$", re.MULTILINE)
+NM_BUS_NAME = "org.freedesktop.NetworkManager"
+NM_PATH = "/org/freedesktop/NetworkManager"
+NM_DEVICE_IFACE = "org.freedesktop.NetworkManager.Device"
+NM_ACTIVE_CONNECTION_IFACE = "org.freedesktop.NetworkManager.Connection.Active"
+NM_DEVICE_STATE_ACTIVATED = 100
+
+T = TypeVar("T")
+
+
+def _ttl_cached(method: Callable[["ShaperBackend"], T]) -> Callable[["ShaperBackend"], T]:
+    @functools.wraps(method)
+    def wrapper(self: "ShaperBackend") -> T:
+        now = time.monotonic()
+        hit = self._probe_cache.get(method.__name__)
+        if hit is not None and now - hit[0] < PROBE_CACHE_TTL:
+            return hit[1]
+        value = method(self)
+        self._probe_cache[method.__name__] = (now, value)
+        return value
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+def _decode_name(raw: bytes) -> str:
+    # "replace", not "ignore": a mangled name must fail _validate_iface rather than become a different valid one.
+    return raw.decode("utf-8", "replace")
+
+
+def parse_nm_objects(objects: Dict[str, Dict[str, Dict[str, Any]]]) -> Optional[Tuple[List[str], Optional[str]]]:
+    # Ifindex 0: NM-only devices without a kernel link (p2p-dev-*, OVS ports).
+    devices: Dict[str, Dict[str, Any]] = {
+        path: ifaces[NM_DEVICE_IFACE]
+        for path, ifaces in objects.items()
+        if NM_DEVICE_IFACE in ifaces and ifaces[NM_DEVICE_IFACE].get("Ifindex")
+    }
+    interfaces = [dev["Interface"] for dev in devices.values() if dev.get("Interface") and dev["Interface"] != "lo"]
+    if not interfaces:
+        return None
 
-IFACE_RE = re.compile(r"^[a-zA-Z0-9_.:-]{1,32}$")
+    primary: Optional[str] = None
+    primary_path = objects.get(NM_PATH, {}).get(NM_BUS_NAME, {}).get("PrimaryConnection", "/")
+    active = objects.get(primary_path, {}).get(NM_ACTIVE_CONNECTION_IFACE, {})
+    for device_path in active.get("Devices", []):
+        device = devices.get(device_path, {})
+        primary = device.get("IpInterface") or device.get("Interface")
+        if primary:
+            break
+    if not primary:
+        activated = [dev["Interface"] for dev in devices.values() if dev.get("State") == NM_DEVICE_STATE_ACTIVATED]
+        primary = next((name for name in activated if name in interfaces), interfaces[0])
+    return interfaces, primary
 
 
 @dataclass
@@ -21,6 +84,10 @@ class BackendResult:
 class ShaperBackend:
     def __init__(self, helper_path: Path) -> None:
         self.helper_path = helper_path
+        self._probe_cache: Dict[str, Tuple[float, Any]] = {}
+
+    def invalidate_cache(self) -> None:
+        self._probe_cache.clear()
 
     def detect_iface(self) -> Optional[str]:
         iface = self._iface_from_ip_route()
@@ -32,20 +99,13 @@ class ShaperBackend:
         links = self.list_interfaces()
         return links[0] if links else None
 
+    @_ttl_cached
     def list_interfaces(self) -> List[str]:
         try:
-            output = subprocess.check_output(["ip", "-o", "link", "show"], text=True)
+            output = subprocess.check_output(["ip", "-o", "link", "show"])
         except (FileNotFoundError, subprocess.SubprocessError):
             return []
-        names = []
-        for line in output.splitlines():
-            parts = line.split(":")
-            if len(parts) < 2:
-                continue
-            name = parts[1].strip()
-            if name and name != "lo":
-                names.append(name)
-        return names
+        return [_decode_name(name) for name in _IP_LINK_NAME_RE.findall(output) if name != b"lo"]
 
     def apply_limits(self, iface: str, down_mbps: int, up_mbps: int) -> BackendResult:
         self._validate(iface, down_mbps, up_mbps)
@@ -87,31 +147,25 @@ class ShaperBackend:
             raise ValueError("invalid_mbps")
 
     def _validate_iface(self, iface: str) -> None:
-        if not IFACE_RE.match(iface):
+        if not 1 <= len(iface) <= 32 or not _IFACE_CHARS.issuperset(iface):
             raise ValueError("invalid_iface")
 
+    @_ttl_cached
     def _iface_from_ip_route(self) -> Optional[str]:
         try:
-            output = subprocess.check_output(["ip", "route", "show", "default"], text=True)
+            output = subprocess.check_output(["ip", "route", "show", "default"])
         except (FileNotFoundError, subprocess.SubprocessError):
             return None
-        for line in output.splitlines():
-            parts = line.split()
-            if "dev" in parts:
-                idx = parts.index("dev")
-                if idx + 1 < len(parts):
-                    return parts[idx + 1]
-        return None
+        match = _IP_ROUTE_DEV_RE.search(output)
+        return _decode_name(match.group(1)) if match else None
 
+    @_ttl_cached
     def _iface_from_nmcli(self) -> Optional[str]:
-        if shutil.which("nmcli") is None:
+        if _which("nmcli") is None:
             return None
         try:
-            output = subprocess.check_output(["nmcli", "-t", "-f", "DEVICE,STATE", "device"], text=True)
-        except subprocess.SubprocessError:
+            output = subprocess.check_output(["nmcli", "-t", "-f", "DEVICE,STATE", "device"])
+        except (FileNotFoundError, subprocess.SubprocessError):
             return None
-        for line in output.splitlines():
-            device, _, state = line.partition(":")
-            if state == "connected" and device:
-                return device
-        return None
+        match = _NMCLI_CONNECTED_RE.search(output)
+        return _decode_name(match.group(1)) if match else None
@@ -1,49 +1,104 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-DEFAULT_PRESETS = [
-    {"name": "Work", "down_mbps": 50, "up_mbps": 10},
-    {"name": "Gaming", "down_mbps": 30, "up_mbps": 15},
-    {"name": "Streaming", "down_mbps": 80, "up_mbps": 20},
-]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_PRESETS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType(preset)
+    for preset in (
+        {"name": "Work", "down_mbps": 50, "up_mbps": 10},
+        {"name": "Gaming", "down_mbps": 30, "up_mbps": 15},
+        {"name": "Streaming", "down_mbps": 80, "up_mbps": 20},
+    )
+)
+DEFAULT_CUSTOM: Mapping[str, int] = MappingProxyType({"down_mbps": 20, "up_mbps": 5})
+
+# "custom" and "presets" are placeholders that keep key order; merge_defaults() fills them.
+_BASE_CONFIG: Dict[str, Any] = {
+    "iface": "",
+    "enabled": False,
+    "active_preset": "Work",
+    "language": "en",
+    "start_on_login": False,
+    "custom": None,
+    "presets": None,
+}
 
 
 class ConfigStore:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._saved_key: Optional[Tuple[int, int]] = None
+        self._saved_payload: Optional[bytes] = None
 
     def load(self) -> Dict[str, Any]:
-        if not self.path.exists():
-            return self.default_config()
         try:
-            with self.path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except (json.JSONDecodeError, OSError):
+            data = _loads(self.path.read_bytes())
+        except (ValueError, OSError):
             return self.default_config()
-        merged = self.default_config()
-        merged.update(data)
-        if not merged.get("presets"):
-            merged["presets"] = DEFAULT_PRESETS.copy()
-        return merged
+        return merge_defaults(data)
 
     def save(self, config: Dict[str, Any]) -> None:
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(config, handle, indent=2)
+        payload = _dumps(config)
+        if payload == self._saved_payload and self._saved_key is not None and self._file_unchanged(self._saved_key):
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._saved_payload = payload
+        self._saved_key = self._stat_key()
+
+    def _stat_key(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _file_unchanged(self, key: Tuple[int, int]) -> bool:
+        try:
+            return self._stat_key() == key
+        except OSError:
+            return False
 
     def default_config(self) -> Dict[str, Any]:
-        return {
-            "iface": "",
-            "enabled": False,
-            "active_preset": "Work",
-            "language": "en",
-            "start_on_login": False,
-            "custom": {"down_mbps": 20, "up_mbps": 5},
-            "presets": [preset.copy() for preset in DEFAULT_PRESETS],
-        }
+        return merge_defaults({})
+
+
+def merge_defaults(data: Any) -> Dict[str, Any]:
+    if not isinstance(data, dict):
+        data = {}
+    merged = {**_BASE_CONFIG, **data}
+    if merged["custom"] is None:
+        merged["custom"] = dict(DEFAULT_CUSTOM)
+    if not merged["presets"]:
+        merged["presets"] = [dict(preset) for preset in DEFAULT_PRESETS]
+    return merged
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
 
 
 def validate_preset(preset: Dict[str, Any]) -> Dict[str, Any]:
@@ -12,7 +12,9 @@ class I18N:
         self.default_language = default_language
         self.language = default_language
         self._catalogs: Dict[str, Dict[str, str]] = {}
+        self._table: Dict[str, str] = {}
         self._load_catalog(default_language)
+        self._rebuild_table()
 
     def available_languages(self) -> Dict[str, str]:
         result: Dict[str, str] = {}
@@ -38,15 +40,17 @@ class I18N:
             language = self.default_language
         self.language = language
         self._load_catalog(language)
+        self._rebuild_table()
 
     def t(self, key: str, **kwargs: object) -> str:
-        catalog = self._catalogs.get(self.language, {})
-        fallback = self._catalogs.get(self.default_language, {})
-        text = catalog.get(key, fallback.get(key, key))
+        text = self._table.get(key, key)
         if kwargs:
-            return text.format(**kwargs)
+            return text.format_map(kwargs)
         return text
 
+    def _rebuild_table(self) -> None:
+        self._table = {**self._catalogs.get(self.default_language, {}), **self._catalogs.get(self.language, {})}
+
     def _load_catalog(self, language: str) -> Dict[str, str]:
         if language in self._catalogs:
             return self._catalogs[language]
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+_HOME = Path.home()
+
+CONFIG_DIR = _HOME / ".config" / "wondershaper-quicktoggle"
+STATE_DIR = _HOME / ".local" / "state" / "wondershaper-quicktoggle"
+CONFIG_PATH = CONFIG_DIR / "config.json"
+LOG_PATH = STATE_DIR / "app.log"
+AUTOSTART_PATH = _HOME / ".config" / "autostart" / "wondershaper-quicktoggle.desktop"
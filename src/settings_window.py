@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+
+from gi.repository import Gtk
+
+from config import validate_preset
+
+if TYPE_CHECKING:
+    from app import QuickToggleApp
+
+
+class SettingsWindow(Gtk.Window):
+    def __init__(self, app: "QuickToggleApp") -> None:
+        super().__init__(title=app.t("settings_title"))
+        self.app = app
+        self.set_default_size(430, 320)
+        self.set_border_width(10)
+
+        root = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        self.add(root)
+
+        # Status indicator at the top
+        status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        status_label = Gtk.Label()
+        status_text = app.t("status_enabled") if app.config.get("enabled") else app.t("status_disabled")
+        active_preset = app.config.get("active_preset", "Work")
+        preset_text = app.t("status_active_preset", preset=active_preset)
+        status_label.set_markup(f"<b>{status_text}</b> — {preset_text}")
+        status_box.pack_start(status_label, True, True, 0)
+        root.pack_start(status_box, False, False, 0)
+
+        separator = Gtk.Separator()
+        root.pack_start(separator, False, False, 0)
+
+        self.iface_combo = Gtk.ComboBoxText()
+        self._fill_ifaces()
+        root.pack_start(self._row(app.t("settings_iface"), self.iface_combo), False, False, 0)
+
+        self.lang_combo = Gtk.ComboBoxText()
+        for code, label in app.i18n.available_languages().items():
+            self.lang_combo.append(code, label)
+        self.lang_combo.set_active_id(app.config["language"])
+        root.pack_start(self._row(app.t("settings_language"), self.lang_combo), False, False, 0)
+
+        self.preset_combo = Gtk.ComboBoxText()
+        self._fill_presets()
+        root.pack_start(self._row(app.t("settings_preset"), self.preset_combo), False, False, 0)
+
+        self.name_entry = Gtk.Entry()
+        self.down_entry = Gtk.Entry()
+        self.up_entry = Gtk.Entry()
+        root.pack_start(self._row(app.t("settings_preset_name"), self.name_entry), False, False, 0)
+        root.pack_start(self._row(app.t("settings_down_mbps"), self.down_entry), False, False, 0)
+        root.pack_start(self._row(app.t("settings_up_mbps"), self.up_entry), False, False, 0)
+
+        self.startup_check = Gtk.CheckButton.new_with_label(app.t("settings_startup"))
+        self.startup_check.set_active(bool(app.config.get("start_on_login", False)))
+        root.pack_start(self.startup_check, False, False, 0)
+
+        preset_mgmt_bar = Gtk.Box(spacing=8)
+        add_preset_btn = Gtk.Button(label=app.t("preset_add"))
+        delete_preset_btn = Gtk.Button(label=app.t("preset_delete"))
+        add_preset_btn.connect("clicked", self.on_add_preset)
+        delete_preset_btn.connect("clicked", self.on_delete_preset)
+        preset_mgmt_bar.pack_start(add_preset_btn, True, True, 0)
+        preset_mgmt_bar.pack_start(delete_preset_btn, True, True, 0)
+        root.pack_start(preset_mgmt_bar, False, False, 0)
+
+        button_bar = Gtk.Box(spacing=8)
+        apply_btn = Gtk.Button(label=app.t("settings_apply_now"))
+        disable_btn = Gtk.Button(label=app.t("settings_disable"))
+        save_btn = Gtk.Button(label=app.t("settings_save"))
+        apply_btn.connect("clicked", self.on_apply)
+        disable_btn.connect("clicked", self.on_disable)
+        save_btn.connect("clicked", self.on_save)
+        button_bar.pack_start(apply_btn, True, True, 0)
+        button_bar.pack_start(disable_btn, True, True, 0)
+        button_bar.pack_start(save_btn, True, True, 0)
+        root.pack_end(button_bar, False, False, 0)
+
+        self.preset_combo.connect("changed", self.on_preset_changed)
+        self._load_current_preset()
+
+    def _row(self, label: str, widget: Gtk.Widget) -> Gtk.Box:
+        row = Gtk.Box(spacing=8)
+        row.pack_start(Gtk.Label(label=label, xalign=0), True, True, 0)
+        row.pack_end(widget, False, False, 0)
+        return row
+
+    def _fill_combo(self, combo: Gtk.ComboBoxText, rows: List[Tuple[str, str]]) -> None:
+        # GtkComboBoxText models are (text, id) string pairs.
+        store = Gtk.ListStore(str, str)
+        for row_id, label in rows:
+            store.append([label, row_id])
+        combo.set_model(store)
+
+    def _fill_ifaces(self) -> None:
+        interfaces = self.app.list_interfaces()
+        self._fill_combo(self.iface_combo, [(iface, iface) for iface in interfaces])
+        current_iface = self.app.get_runtime_iface()
+        if current_iface:
+            self.iface_combo.set_active_id(current_iface)
+
+    def _fill_presets(self) -> None:
+        rows = [(preset["name"], preset["name"]) for preset in self.app.config["presets"]]
+        rows.append(("Custom", self.app.t("preset_custom")))
+        self._fill_combo(self.preset_combo, rows)
+        self.preset_combo.set_active_id(self.app.config.get("active_preset", "Work"))
+
+    def _load_current_preset(self) -> None:
+        preset_name = self.preset_combo.get_active_id() or self.app.config.get("active_preset", "Work")
+        if preset_name == "Custom":
+            data = self.app.config["custom"]
+            self.name_entry.set_text(self.app.t("preset_custom"))
+        else:
+            data = self.app.find_preset(preset_name) or self.app.config["presets"][0]
+            self.name_entry.set_text(data["name"])
+        self.down_entry.set_text(str(data["down_mbps"]))
+        self.up_entry.set_text(str(data["up_mbps"]))
+
+    def on_preset_changed(self, _widget: Gtk.Widget) -> None:
+        self._load_current_preset()
+
+    def on_add_preset(self, _widget: Gtk.Widget) -> None:
+        name = self.name_entry.get_text().strip()
+        if not name:
+            self.app.notify("error_preset_empty_name")
+            return
+        try:
+            down_mbps = int(self.down_entry.get_text())
+            up_mbps = int(self.up_entry.get_text())
+            new_preset = {"name": name, "down_mbps": down_mbps, "up_mbps": up_mbps}
+            validate_preset(new_preset)
+            self.app.config["presets"].append(new_preset)
+            self.app.rebuild_preset_index()
+            self.app.save_config()
+            self.app.refresh_menu()
+            self._fill_presets()
+            self.preset_combo.set_active_id(name)
+            self.app.notify("preset_added")
+        except (ValueError, TypeError):
+            self.app.notify("error_invalid_values")
+
+    def on_delete_preset(self, _widget: Gtk.Widget) -> None:
+        if len(self.app.config["presets"]) <= 1:
+            self.app.notify("error_cannot_delete_last")
+            return
+        selected = self.preset_combo.get_active_id()
+        if selected == "Custom":
+            self.app.notify("error_cannot_delete_last")
+            return
+        self.app.config["presets"] = [p for p in self.app.config["presets"] if p["name"] != selected]
+        if self.app.config.get("active_preset") == selected:
+            self.app.config["active_preset"] = self.app.config["presets"][0]["name"]
+        self.app.rebuild_preset_index()
+        self.app.save_config()
+        self.app.refresh_menu()
+        self._fill_presets()
+        self.app.notify("preset_deleted")
+
+    def on_apply(self, _widget: Gtk.Widget) -> None:
+        self._save_to_config()
+        self.app.toggle_on(force=True)
+
+    def on_disable(self, _widget: Gtk.Widget) -> None:
+        self._save_to_config()
+        self.app.toggle_off(force=True)
+
+    def on_save(self, _widget: Gtk.Widget) -> None:
+        self._save_to_config()
+        self.app.notify("notify_saved")
+
+    def _save_to_config(self) -> None:
+        iface = self.iface_combo.get_active_id() or ""
+        language = self.lang_combo.get_active_id() or "en"
+        selected = self.preset_combo.get_active_id() or "Work"
+        self.app.config["iface"] = iface
+        self.app.resolve_iface()
+        self.app.config["language"] = language
+        self.app.i18n.set_language(language)
+
+        try:
+            down_mbps = int(self.down_entry.get_text())
+            up_mbps = int(self.up_entry.get_text())
+            if selected == "Custom":
+                self.app.config["custom"] = {"down_mbps": down_mbps, "up_mbps": up_mbps}
+            else:
+                new_preset = {"name": self.name_entry.get_text(), "down_mbps": down_mbps, "up_mbps": up_mbps}
+                updated = validate_preset(new_preset)
+                replaced = False
+                for idx, preset in enumerate(self.app.config["presets"]):
+                    if preset["name"] == selected:
+                        self.app.config["presets"][idx] = updated
+                        replaced = True
+                        break
+                if not replaced:
+                    self.app.config["presets"].append(updated)
+                selected = updated["name"]
+        except (ValueError, TypeError):
+            self.app.notify("error_invalid_values")
+            return
+
+        self.app.rebuild_preset_index()
+        self.app.config["active_preset"] = selected
+        self.app.config["start_on_login"] = self.startup_check.get_active()
+        self.app.sync_autostart()
+        self.app.save_config()
+        self.app.refresh_menu()
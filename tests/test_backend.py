@@ -0,0 +1,123 @@
+"""Tests for backend module."""
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from backend import NM_ACTIVE_CONNECTION_IFACE, NM_BUS_NAME, NM_DEVICE_IFACE, NM_PATH, ShaperBackend, _which, parse_nm_objects
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> ShaperBackend:
+    return ShaperBackend(helper_path=tmp_path / "wsqt_helper.py")
+
+
+class TestValidateIface:
+    @pytest.mark.parametrize("iface", ["eth0", "wlp2s0", "enp0s31f6", "br-lan.10", "eth0:1", "a" * 32])
+    def test_valid_names(self, backend: ShaperBackend, iface: str) -> None:
+        backend._validate_iface(iface)
+
+    @pytest.mark.parametrize("iface", ["", "a" * 33, "eth 0", "eth0;rm", "eth0\n", "wlän0", "../etc"])
+    def test_invalid_names_raise(self, backend: ShaperBackend, iface: str) -> None:
+        with pytest.raises(ValueError, match="invalid_iface"):
+            backend._validate_iface(iface)
+
+    def test_apply_rejects_out_of_range_rates(self, backend: ShaperBackend) -> None:
+        with pytest.raises(ValueError, match="invalid_mbps"):
+            backend.apply_limits("eth0", 0, 10)
+
+
+class TestProbeCache:
+    def test_list_interfaces_reuses_recent_result(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: List[Any] = []
+
+        def fake_check_output(cmd: List[str], **_kwargs: Any) -> bytes:
+            calls.append(cmd)
+            return b"1: lo: <LOOPBACK>\n2: eth0: <BROADCAST>\n"
+
+        monkeypatch.setattr(subprocess, "check_output", fake_check_output)
+        assert backend.list_interfaces() == ["eth0"]
+        assert backend.list_interfaces() == ["eth0"]
+        assert len(calls) == 1
+        backend.invalidate_cache()
+        backend.list_interfaces()
+        assert len(calls) == 2
+
+
+class TestProbeParsing:
+    @pytest.fixture(autouse=True)
+    def _clear_which_cache(self) -> Iterator[None]:
+        _which.cache_clear()
+        yield
+        _which.cache_clear()
+
+    def test_list_interfaces_parses_ip_link(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = (
+            b"1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536 qdisc noqueue state UNKNOWN\\    link/loopback 00:00:00:00:00:00\n"
+            b"2: enp3s0: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc fq_codel state UP\\    link/ether 52:54:00:12:34:56\n"
+            b"5: veth1@if4: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue state UP\\    link/ether 0e:aa:bb:cc:dd:ee\n"
+        )
+        monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: output)
+        assert backend.list_interfaces() == ["enp3s0", "veth1"]
+
+    def test_detect_iface_prefers_default_route(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = b"default via 192.168.1.1 dev wlp2s0 proto dhcp src 192.168.1.20 metric 600\n"
+        monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: output)
+        assert backend.detect_iface() == "wlp2s0"
+
+    def test_iface_from_nmcli_picks_connected_device(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = b"lo:connected (externally)\nwlp2s0:disconnected\nenp3s0:connected\n"
+        monkeypatch.setattr(shutil, "which", lambda _name: "/usr/bin/nmcli")
+        monkeypatch.setattr(subprocess, "check_output", lambda *_args, **_kwargs: output)
+        assert backend._iface_from_nmcli() == "enp3s0"
+
+    def test_iface_from_nmcli_removed_after_lookup(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        def missing(*_args: Any, **_kwargs: Any) -> bytes:
+            raise FileNotFoundError("nmcli")
+
+        monkeypatch.setattr(shutil, "which", lambda _name: "/usr/bin/nmcli")
+        monkeypatch.setattr(subprocess, "check_output", missing)
+        assert backend._iface_from_nmcli() is None
+
+    def test_iface_from_nmcli_without_nmcli(self, backend: ShaperBackend, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(shutil, "which", lambda _name: None)
+        assert backend._iface_from_nmcli() is None
+
+
+def _nm_device(name: str, ifindex: int, state: int = 30, ip_iface: str = "") -> Dict[str, Dict[str, Any]]:
+    return {NM_DEVICE_IFACE: {"Interface": name, "IpInterface": ip_iface, "Ifindex": ifindex, "State": state}}
+
+
+class TestParseNmObjects:
+    def test_primary_connection_device(self) -> None:
+        objects = {
+            NM_PATH: {NM_BUS_NAME: {"PrimaryConnection": "/ac/1"}},
+            "/ac/1": {NM_ACTIVE_CONNECTION_IFACE: {"Devices": ["/dev/3"]}},
+            "/dev/1": _nm_device("lo", 1, 100),
+            "/dev/2": _nm_device("enp3s0", 2, 100),
+            "/dev/3": _nm_device("wwan0", 3, 100, ip_iface="wwp0s20u4i6"),
+        }
+        assert parse_nm_objects(objects) == (["enp3s0", "wwan0"], "wwp0s20u4i6")
+
+    def test_no_primary_prefers_activated_device(self) -> None:
+        objects = {
+            NM_PATH: {NM_BUS_NAME: {"PrimaryConnection": "/"}},
+            "/dev/1": _nm_device("enp3s0", 2, 30),
+            "/dev/2": _nm_device("wlp2s0", 3, 100),
+        }
+        assert parse_nm_objects(objects) == (["enp3s0", "wlp2s0"], "wlp2s0")
+
+    def test_skips_devices_without_ifindex(self) -> None:
+        objects = {
+            "/dev/1": _nm_device("p2p-dev-wlp2s0", 0, 30),
+            "/dev/2": _nm_device("wlp2s0", 3, 30),
+        }
+        assert parse_nm_objects(objects) == (["wlp2s0"], "wlp2s0")
+        assert parse_nm_objects({"/dev/1": _nm_device("p2p-dev-wlp2s0", 0, 100)}) is None
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -9,7 +10,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from config import ConfigStore, clamp_mbps, validate_preset
+from config import DEFAULT_PRESETS, ConfigStore, clamp_mbps, validate_preset
 
 
 class TestConfigStore:
@@ -37,6 +38,47 @@ class TestConfigStore:
         loaded = store.load()
         assert loaded["iface"] == "eth0"
 
+    def test_save_replaces_file_without_leftovers(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{bad json!!!", encoding="utf-8")
+        store = ConfigStore(config_path)
+        store.save(store.default_config())
+        assert json.loads(config_path.read_text(encoding="utf-8"))["iface"] == ""
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+    def test_failed_save_removes_temp_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config_path = tmp_path / "config.json"
+        store = ConfigStore(config_path)
+
+        def failing_replace(*_args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            store.save(store.default_config())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_save_skips_identical_payload(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.json"
+        store = ConfigStore(config_path)
+        cfg = store.default_config()
+        store.save(cfg)
+        inode = config_path.stat().st_ino
+        store.save(cfg)
+        assert config_path.stat().st_ino == inode
+        cfg["iface"] = "eth0"
+        store.save(cfg)
+        assert config_path.stat().st_ino != inode
+
+    def test_save_rewrites_missing_file(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.json"
+        store = ConfigStore(config_path)
+        cfg = store.default_config()
+        store.save(cfg)
+        config_path.unlink()
+        store.save(cfg)
+        assert config_path.exists()
+
     def test_load_merges_with_defaults(self, tmp_path: Path) -> None:
         config_path = tmp_path / "config.json"
         config_path.write_text(json.dumps({"iface": "wlan0"}), encoding="utf-8")
@@ -46,6 +88,26 @@ class TestConfigStore:
         assert "enabled" in cfg
         assert len(cfg["presets"]) == 3
 
+    def test_load_non_object_json_returns_default(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.json"
+        config_path.write_text("[1, 2, 3]", encoding="utf-8")
+        cfg = ConfigStore(config_path).load()
+        assert cfg["iface"] == ""
+        assert len(cfg["presets"]) == 3
+
+    def test_default_presets_are_not_shared(self, tmp_path: Path) -> None:
+        store = ConfigStore(tmp_path / "config.json")
+        first = store.default_config()
+        first["presets"][0]["down_mbps"] = 1
+        first["custom"]["up_mbps"] = 1
+        second = store.default_config()
+        assert second["presets"][0]["down_mbps"] == 50
+        assert second["custom"]["up_mbps"] == 5
+
+    def test_canonical_defaults_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            DEFAULT_PRESETS[0]["down_mbps"] = 1  # type: ignore[index]
+
 
 class TestValidatePreset:
     def test_valid_preset(self) -> None:
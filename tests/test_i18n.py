@@ -23,6 +23,16 @@ class TestI18N:
         i = I18N(tmp_path)
         assert i.t("missing_key") == "missing_key"
 
+    def test_missing_key_falls_back_to_default_language(self, tmp_path: Path) -> None:
+        (tmp_path / "en.json").write_text(json.dumps({"hello": "Hello", "bye": "Bye"}), encoding="utf-8")
+        (tmp_path / "fr.json").write_text(json.dumps({"hello": "Bonjour"}), encoding="utf-8")
+        i = I18N(tmp_path)
+        i.set_language("fr")
+        assert i.t("hello") == "Bonjour"
+        assert i.t("bye") == "Bye"
+        i.set_language("en")
+        assert i.t("hello") == "Hello"
+
     def test_available_languages(self, tmp_path: Path) -> None:
         (tmp_path / "en.json").write_text(json.dumps({"language_name": "English"}), encoding="utf-8")
         (tmp_path / "fr.json").write_text(json.dumps({"language_name": "Français"}), encoding="utf-8")